@@ -1,16 +1,15 @@
 import asyncio
-import io
 import logging
 import os
 import time
+from collections import OrderedDict
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from fastapi import Depends, FastAPI, HTTPException, Request, Response
 from fastapi.responses import HTMLResponse
 from fastapi.responses import RedirectResponse
 from fastapi.staticfiles import StaticFiles
-from starlette.responses import StreamingResponse
 
 from compliance_agent.agent import session_service
 from compliance_agent.api.models import (
@@ -38,6 +37,10 @@ from compliance_agent.services import PDFService, get_report_for_session
 
 logger = logging.getLogger(__name__)
 
+# Duplicate /run submissions (same user and request_id) share one agent execution.
+RUN_DEDUP_TTL_SECONDS = float(os.getenv("RUN_DEDUP_TTL_SECONDS", "600"))
+RUN_DEDUP_MAX_SIZE = int(os.getenv("RUN_DEDUP_MAX_SIZE", "256"))
+
 
 def _read_static_html(filename: str) -> str:
     """Read an HTML file from the current working directory."""
@@ -88,6 +91,38 @@ def create_app(agent: AgentProtocol) -> FastAPI:
     app.mount("/static", StaticFiles(directory=os.path.join(os.getcwd(), "static")), name="static")
 
     billing_service = BillingService()
+    recent_runs: "OrderedDict[Tuple[str, str], Tuple[asyncio.Future, float]]" = OrderedDict()
+
+    async def _execute_once(user_key: str, payload: AssessRequest) -> Optional[dict]:
+        """Run the agent, joining an earlier run of the same request_id when there is one."""
+        if not payload.request_id:
+            return await agent.execute(payload)
+
+        run_key = (user_key, payload.request_id)
+        now = time.monotonic()
+        entry = recent_runs.get(run_key)
+        if entry is not None and now - entry[1] <= RUN_DEDUP_TTL_SECONDS:
+            logger.info(f"Joining existing run for request {payload.request_id}")
+            run = entry[0]
+        else:
+            run = asyncio.ensure_future(agent.execute(payload))
+            recent_runs[run_key] = (run, now)
+            while len(recent_runs) > RUN_DEDUP_MAX_SIZE:
+                recent_runs.popitem(last=False)
+
+            def _forget_unsuccessful_run(finished: asyncio.Future) -> None:
+                # Failed runs are dropped so the client can retry with the same request_id.
+                if finished.cancelled() or finished.exception() is not None or finished.result() is None:
+                    current = recent_runs.get(run_key)
+                    if current is not None and current[0] is finished:
+                        del recent_runs[run_key]
+
+            run.add_done_callback(_forget_unsuccessful_run)
+
+        # Shielded so a disconnecting duplicate cannot cancel the shared execution.
+        result = await asyncio.shield(run)
+        # Each response gets its own copy; the billing fields below are set per request.
+        return None if result is None else dict(result)
 
     @app.middleware("http")
     async def log_request_latency(request: Request, call_next) -> Response:
@@ -164,7 +199,7 @@ def create_app(agent: AgentProtocol) -> FastAPI:
     async def run(
             payload: AssessRequest,
             auth_user: AuthenticatedUser = Depends(get_authenticated_user),
-    ) -> Optional[AssessResponse]:
+    ) -> dict:
         """Run a compliance assessment for the specified AI tool."""
         logger.info(f"Running assessment - requesting user {auth_user.email}, tool {payload.ai_tool}")
         if billing_service.is_enabled():
@@ -178,7 +213,7 @@ def create_app(agent: AgentProtocol) -> FastAPI:
             payload.user_email = auth_user.email
 
         try:
-            response = await agent.execute(payload)
+            response = await _execute_once(auth_user.subject, payload)
         except InsufficientCreditsError as exc:
             raise HTTPException(status_code=402, detail=str(exc)) from exc
 
@@ -189,6 +224,8 @@ def create_app(agent: AgentProtocol) -> FastAPI:
             credit_state = await billing_service.get_daily_credit_state(user_id=payload.user_sub)
             response["credits_left_today"] = credit_state.credits_left_today
             response["billing_status"] = "ok"
+            # Full quota state so the UI can refresh its credits without a /billing/me call.
+            response["billing"] = BillingStateResponse(**credit_state.__dict__)
 
         return response
 
@@ -397,7 +434,7 @@ def create_app(agent: AgentProtocol) -> FastAPI:
     async def get_pdf(
             session_id: str,
             auth_user: AuthenticatedUser = Depends(get_authenticated_user),
-    ) -> StreamingResponse:
+    ) -> Response:
         """Generate PDF for a given session ID."""
         logger.info(f"Generating PDF for session {session_id}")
         report = await get_report_for_session(session_id, auth_user.email)
@@ -411,7 +448,7 @@ def create_app(agent: AgentProtocol) -> FastAPI:
             raise HTTPException(status_code=400, detail="Report has no summary content")
 
         try:
-            pdf_content = PDFService.generate_pdf_cached(
+            pdf_content = await PDFService.generate_pdf_cached_async(
                 report_content=report["summary"],
                 ai_tool_name=report["ai_tool"],
                 session_id=session_id,
@@ -427,8 +464,11 @@ def create_app(agent: AgentProtocol) -> FastAPI:
             c if c.isalnum() or c in (" ", "-", "_") else "_" for c in report["ai_tool"]
         ).strip()
 
-        return StreamingResponse(
-            io.BytesIO(pdf_content),
+        # The PDF is already fully materialized (and cached), so send it in one body
+        # with Content-Length instead of re-wrapping it in a BytesIO and streaming
+        # it back out line by line.
+        return Response(
+            content=pdf_content,
             media_type="application/pdf",
             headers={
                 "Content-Disposition": f'attachment; filename="ai_tool_assessment_{safe_tool_name}.pdf"'
@@ -13,6 +13,16 @@ class AssessRequest(BaseModel):
     user_sub: Optional[str] = None
 
 
+class BillingStateResponse(BaseModel):
+    """Model for user daily quota state response."""
+
+    daily_limit: int
+    used_today: int
+    credits_left_today: int
+    can_run_request: bool
+    resets_at_utc: str
+
+
 class AssessResponse(BaseModel):
     """Response model for AI tool compliance assessment."""
 
@@ -20,6 +30,7 @@ class AssessResponse(BaseModel):
     session_id: str
     credits_left_today: Optional[int] = None
     billing_status: Optional[str] = None
+    billing: Optional[BillingStateResponse] = None
 
 
 class SessionInfo(BaseModel):
@@ -66,16 +77,6 @@ class HealthResponse(BaseModel):
     database: Optional[ComponentHealth] = None
 
 
-class BillingStateResponse(BaseModel):
-    """Model for user daily quota state response."""
-
-    daily_limit: int
-    used_today: int
-    credits_left_today: int
-    can_run_request: bool
-    resets_at_utc: str
-
-
 class UIBootstrapResponse(BaseModel):
     """Combined response model for initial Streamlit UI bootstrap."""
 
@@ -88,7 +89,7 @@ class UIBootstrapResponse(BaseModel):
 class AgentProtocol(Protocol):
     """Protocol defining the interface for compliance assessment agents."""
 
-    async def execute(self, request: AssessRequest) -> Optional[AssessResponse]:
+    async def execute(self, request: AssessRequest) -> Optional[dict]:
         """
         Execute a compliance assessment for the given request.
 
@@ -96,6 +97,7 @@ class AgentProtocol(Protocol):
             request: Assessment request containing AI tool name and optional session ID.
 
         Returns:
-            Assessment response with summary and session ID, or None if execution fails.
+            Dictionary with 'summary' and 'session_id' (the AssessResponse fields),
+            or None if execution fails.
         """
         ...
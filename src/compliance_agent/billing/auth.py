@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
 from dataclasses import dataclass
 from typing import Optional
@@ -67,5 +68,6 @@ def _verify_token(token: str) -> dict:
 async def get_authenticated_user(authorization: Optional[str] = Header(default=None)) -> AuthenticatedUser:
     """Resolve an authenticated user from a Google ID bearer token."""
     token = _extract_bearer_token(authorization)
-    decoded = _verify_token(token)
+    # Certificate fetch + signature check is blocking I/O; keep it off the event loop.
+    decoded = await asyncio.to_thread(_verify_token, token)
     return AuthenticatedUser(subject=decoded["sub"], email=decoded["email"])
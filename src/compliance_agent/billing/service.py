@@ -4,11 +4,14 @@ from __future__ import annotations
 
 import logging
 import os
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from hashlib import blake2b
 from typing import Optional
 
-from sqlalchemy import Select, func, select
+from sqlalchemy import Select, bindparam, func, insert, select, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
@@ -17,6 +20,22 @@ from compliance_agent.billing.models import BillingUser, CreditLedgerEntry, Ledg
 
 logger = logging.getLogger(__name__)
 
+# Built once at import so debits skip constructing the Select in Python. The rendered
+# SQL is the same as a per-call select; caching of the compiled form is unchanged.
+_IDEMPOTENCY_LOOKUP_STMT: Select = select(CreditLedgerEntry.id).where(
+    CreditLedgerEntry.idempotency_key == bindparam("idempotency_key")
+)
+
+
+def request_debit_idempotency_key(user_id: str, request_id: str) -> str:
+    """Derive a fixed-width idempotency key for a request debit.
+
+    Hashing keeps every key at 32 hex characters regardless of id lengths, so the
+    unique index on credit_ledger.idempotency_key stays compact and cheap to probe.
+    """
+    digest = blake2b(f"request-debit:{user_id}:{request_id}".encode("utf-8"), digest_size=16)
+    return digest.hexdigest()
+
 
 class InsufficientCreditsError(Exception):
     """Raised when a user has no daily credits left."""
@@ -44,30 +63,69 @@ class BillingUserRef:
 class BillingService:
     """Service for all daily quota operations."""
 
+    _user_cache_ttl_seconds: float = float(os.getenv("BILLING_USER_CACHE_TTL_SECONDS", "60"))
+    _user_cache_max_size: int = int(os.getenv("BILLING_USER_CACHE_SIZE", "1024"))
+
     def __init__(self, session_factory: Optional[async_sessionmaker[AsyncSession]] = None):
         self._session_factory = session_factory or get_session_factory()
         self._daily_limit = int(os.getenv("DAILY_FREE_CREDITS", "20"))
+        self._enabled = os.getenv("BILLING_ENABLED", "true").lower() == "true"
+        self._user_cache: "OrderedDict[str, tuple[BillingUserRef, float]]" = OrderedDict()
 
     async def ensure_user(self, google_sub: str, email: str) -> BillingUserRef:
         """Create or retrieve user identity used for quota tracking."""
+        cached = self._get_cached_user(google_sub=google_sub, email=email)
+        if cached is not None:
+            return cached
+
         try:
-            return await self._ensure_user_once(google_sub=google_sub, email=email)
+            user_ref = await self._ensure_user_once(google_sub=google_sub, email=email)
         except IntegrityError:
             # Rare concurrent first-login race: retry once.
-            return await self._ensure_user_once(google_sub=google_sub, email=email)
+            user_ref = await self._ensure_user_once(google_sub=google_sub, email=email)
+
+        self._cache_user(google_sub=google_sub, user_ref=user_ref)
+        return user_ref
+
+    def _get_cached_user(self, google_sub: str, email: str) -> Optional[BillingUserRef]:
+        """Return a recently resolved user ref when the identity is unchanged."""
+        entry = self._user_cache.get(google_sub)
+        if entry is None:
+            return None
+
+        user_ref, cached_at = entry
+        if user_ref.email != email or time.monotonic() - cached_at > self._user_cache_ttl_seconds:
+            # Email changes must reach the database, so treat them as a miss.
+            self._user_cache.pop(google_sub, None)
+            return None
+
+        self._user_cache.move_to_end(google_sub)
+        return user_ref
+
+    def _cache_user(self, google_sub: str, user_ref: BillingUserRef) -> None:
+        self._user_cache[google_sub] = (user_ref, time.monotonic())
+        self._user_cache.move_to_end(google_sub)
+        while len(self._user_cache) > self._user_cache_max_size:
+            self._user_cache.popitem(last=False)
 
     async def _ensure_user_once(self, google_sub: str, email: str) -> BillingUserRef:
         async with self._session_factory() as session:
             async with session.begin():
-                user = await self._get_user_for_update(session=session, google_sub=google_sub)
-                if user is None:
+                existing = await self._get_user_for_update(session=session, google_sub=google_sub)
+                if existing is None:
                     user = BillingUser(google_sub=google_sub, email=email)
                     session.add(user)
                     await session.flush()
+                    return BillingUserRef(id=user.id, email=user.email)
 
-                user.email = email
+                user_id, current_email = existing
+                if current_email != email:
+                    # Single-column flip: bare UPDATE instead of loading the entity for dirty tracking.
+                    await session.execute(
+                        update(BillingUser).where(BillingUser.id == user_id).values(email=email)
+                    )
 
-            return BillingUserRef(id=user.id, email=user.email)
+            return BillingUserRef(id=user_id, email=email)
 
     async def consume_daily_credit_for_request(
         self,
@@ -79,14 +137,13 @@ class BillingService:
     ) -> int:
         """Atomically consume one daily credit for each accepted assessment request."""
         day_start, next_day_start = self._utc_day_bounds()
-        idempotency_key = f"request-debit:{user_id}:{request_id}"
+        idempotency_key = request_debit_idempotency_key(user_id=user_id, request_id=request_id)
 
         async with self._session_factory() as session:
             async with session.begin():
-                existing_stmt: Select = select(CreditLedgerEntry.id).where(
-                    CreditLedgerEntry.idempotency_key == idempotency_key
-                )
-                existing = (await session.execute(existing_stmt)).scalar_one_or_none()
+                existing = (
+                    await session.execute(_IDEMPOTENCY_LOOKUP_STMT, {"idempotency_key": idempotency_key})
+                ).scalar_one_or_none()
                 if existing is not None:
                     used_today = await self._used_today(
                         session=session,
@@ -110,8 +167,9 @@ class BillingService:
                     )
 
                 remaining_after = self._daily_limit - (used_today + 1)
-                session.add(
-                    CreditLedgerEntry(
+                # Write-only row: a Core insert skips identity-map and unit-of-work bookkeeping.
+                await session.execute(
+                    insert(CreditLedgerEntry).values(
                         user_id=user_id,
                         delta=-1,
                         reason=LedgerReason.REQUEST_DEBIT,
@@ -160,9 +218,17 @@ class BillingService:
         )
         return int((await session.execute(stmt)).scalar_one())
 
-    async def _get_user_for_update(self, session: AsyncSession, google_sub: str) -> Optional[BillingUser]:
-        stmt: Select = select(BillingUser).where(BillingUser.google_sub == google_sub).with_for_update()
-        return (await session.execute(stmt)).scalar_one_or_none()
+    async def _get_user_for_update(self, session: AsyncSession, google_sub: str) -> Optional[tuple[str, str]]:
+        """Lock the user row and return its (id, email), or None if it does not exist."""
+        stmt = (
+            select(BillingUser.id, BillingUser.email)
+            .where(BillingUser.google_sub == google_sub)
+            .with_for_update()
+        )
+        row = (await session.execute(stmt)).one_or_none()
+        if row is None:
+            return None
+        return row[0], row[1]
 
     async def find_user_by_id(self, user_id: str) -> Optional[BillingUserRef]:
         """Resolve billing user by internal id."""
@@ -174,7 +240,7 @@ class BillingService:
 
     def is_enabled(self) -> bool:
         """Whether daily quota enforcement is enabled by configuration."""
-        return os.getenv("BILLING_ENABLED", "true").lower() == "true"
+        return self._enabled
 
     def _utc_day_bounds(self) -> tuple[datetime, datetime]:
         now_utc = datetime.now(timezone.utc)
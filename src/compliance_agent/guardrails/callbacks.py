@@ -7,7 +7,7 @@ This module contains all guardrail callback functions that protect the agent fro
 """
 import logging
 import re
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 
 from google.adk.tools.tool_context import ToolContext
 from google.genai import types
@@ -28,6 +28,17 @@ BLOCKED_INPUT_PATTERNS = [
     r"roleplay as",
 ]
 
+# All injection patterns folded into one case-insensitive alternation, compiled once
+# at import, so each input is scanned in a single pass without lowercasing it first;
+# the named group that matched maps back to the offending pattern.
+_BLOCKED_INPUT_GROUPS: Dict[str, str] = {
+    f"p{index}": pattern for index, pattern in enumerate(BLOCKED_INPUT_PATTERNS)
+}
+_BLOCKED_INPUT_RE = re.compile(
+    "|".join(f"(?P<{group}>{pattern})" for group, pattern in _BLOCKED_INPUT_GROUPS.items()),
+    re.IGNORECASE,
+)
+
 # Maximum input length for AI tool names
 MAX_INPUT_LENGTH = 500
 
@@ -66,6 +77,36 @@ COMPLIANCE_SEARCH_TERMS = [
     "audit",
 ]
 
+# Rejection messages are fixed for the process lifetime, so build the text once.
+_INPUT_TOO_LONG_MESSAGE = (
+    f"Input too long. Please limit your AI tool name/request to {MAX_INPUT_LENGTH} characters."
+)
+_DISALLOWED_INPUT_MESSAGE = (
+    "Your request contains disallowed patterns. I can only assist with EU AI Act "
+    "compliance assessments. Please provide a valid AI tool name."
+)
+
+
+def _compile_term_alternation(terms: List[str]) -> re.Pattern:
+    """Compile literal terms into one alternation that finds any of them in a single scan."""
+    # Longest first so a term is never shadowed by a shorter one sharing its prefix.
+    escaped = (re.escape(term.lower()) for term in sorted(terms, key=len, reverse=True))
+    return re.compile("|".join(escaped))
+
+
+_BLOCKED_SEARCH_RE = _compile_term_alternation(BLOCKED_SEARCH_TERMS)
+_COMPLIANCE_SEARCH_RE = _compile_term_alternation(COMPLIANCE_SEARCH_TERMS)
+
+
+def _model_reply(text: str) -> types.Content:
+    """
+    Wrap a constant rejection message in a fresh model Content.
+
+    ADK stores the returned Content on a session event, so a new (cheap) instance is
+    built per rejection rather than sharing one mutable pydantic object across sessions.
+    """
+    return types.Content(role="model", parts=[types.Part(text=text)])
+
 
 def validate_input_guardrail(callback_context) -> Optional[types.Content]:
     """
@@ -98,27 +139,14 @@ def validate_input_guardrail(callback_context) -> Optional[types.Content]:
 
     if len(user_input) > MAX_INPUT_LENGTH:
         logger.warning(f"GUARDRAIL: Input rejected - too long ({len(user_input)} chars)")
-        return types.Content(
-            role="model",
-            parts=[
-                types.Part(
-                    text=f"Input too long. Please limit your AI tool name/request to {MAX_INPUT_LENGTH} characters."
-                )
-            ],
-        )
-
-    user_input_lower = user_input.lower()
-    for pattern in BLOCKED_INPUT_PATTERNS:
-        if re.search(pattern, user_input_lower):
-            logger.warning(f"GUARDRAIL: Input rejected - matched blocked pattern: {pattern}")
-            return types.Content(
-                role="model",
-                parts=[
-                    types.Part(
-                        text="Your request contains disallowed patterns. I can only assist with EU AI Act compliance assessments. Please provide a valid AI tool name."
-                    )
-                ],
-            )
+        return _model_reply(_INPUT_TOO_LONG_MESSAGE)
+
+    match = _BLOCKED_INPUT_RE.search(user_input)
+    if match:
+        # Every alternative is a named group, so lastgroup is always set on a match.
+        pattern = _BLOCKED_INPUT_GROUPS[match.lastgroup] if match.lastgroup else match.group()
+        logger.warning(f"GUARDRAIL: Input rejected - matched blocked pattern: {pattern}")
+        return _model_reply(_DISALLOWED_INPUT_MESSAGE)
 
     logger.debug("GUARDRAIL: Input validated successfully")
     return None
@@ -143,16 +171,17 @@ def tool_input_guardrail(
         query = args.get("query", "").lower()
 
         # Block dangerous/off-topic search terms
-        for blocked in BLOCKED_SEARCH_TERMS:
-            if blocked in query:
-                logger.warning(f"GUARDRAIL: Search blocked - contains term: {blocked}")
-                return {
-                    "blocked": True,
-                    "reason": f"Search query contains off-topic term '{blocked}'. Please focus on compliance-related searches for the AI tool.",
-                }
+        blocked_match = _BLOCKED_SEARCH_RE.search(query)
+        if blocked_match:
+            blocked = blocked_match.group(0)
+            logger.warning(f"GUARDRAIL: Search blocked - contains term: {blocked}")
+            return {
+                "blocked": True,
+                "reason": f"Search query contains off-topic term '{blocked}'. Please focus on compliance-related searches for the AI tool.",
+            }
 
         # Log warning if a query doesn't seem compliance-related
-        has_compliance_term = any(term in query for term in COMPLIANCE_SEARCH_TERMS)
+        has_compliance_term = _COMPLIANCE_SEARCH_RE.search(query) is not None
         if not has_compliance_term:
             logger.warning(f"GUARDRAIL WARNING: Query may not be compliance-related: {query}")
         else:
@@ -1,3 +1,4 @@
+import asyncio
 import io
 import logging
 import os
@@ -6,7 +7,7 @@ from collections import OrderedDict
 from datetime import datetime
 from hashlib import sha256
 from threading import Lock
-from typing import List, Optional, Tuple
+from typing import BinaryIO, Iterator, List, Optional, Tuple
 
 import markdown
 from reportlab.lib.colors import blue, black
@@ -20,12 +21,130 @@ from compliance_agent.config import APP_NAME, DISCLAIMER_TEXT
 
 logger = logging.getLogger(__name__)
 
+# Block-level tags emitted by python-markdown. Text between two of these boundaries
+# belongs to the innermost open text block and becomes one Paragraph; list items, table
+# rows and definition terms/descriptions are blocks of their own so they keep one line
+# per item. Text outside any text block (e.g. raw HTML) is still rendered as a paragraph.
+_HTML_BOUNDARY_RE = re.compile(
+    r"<(/?)(h[1-6]|p|li|pre|tr|dt|dd|ul|ol|dl|table|thead|tbody|div|blockquote|hr)\b[^>]*>"
+)
+_TEXT_BLOCK_TAGS = frozenset(
+    {"h1", "h2", "h3", "h4", "h5", "h6", "p", "li", "pre", "tr", "dt", "dd"}
+)
+# Blocks that usually come in long runs of short lines and are merged into one Paragraph,
+# keyed to the run they belong to.
+_BATCHED_BLOCK_TAGS = {"li": "li", "tr": "tr", "dt": "dl", "dd": "dl"}
+_TABLE_CELL_BREAK_RE = re.compile(r"</t[dh]>\s*<t[dh][^>]*>")
+_TABLE_CELL_TAG_RE = re.compile(r"</?t[dh]\b[^>]*>")
+_LIST_TAGS = frozenset({"ul", "ol"})
+# Nested list items stay on their own line inside the merged list Paragraph and are
+# indented per level, since ReportLab paragraphs cannot hold real sub-lists.
+_NESTED_LIST_INDENT = "&nbsp;" * 4
+# Link text may not contain brackets and URLs may not contain parentheses or whitespace,
+# so neither group can run across neighbouring links.
+_MARKDOWN_LINK_RE = re.compile(r"\[([^\[\]]+)\]\(([^()\s]+)\)")
+
+# Heading carried by the agent's final report, and the prefix of the initial assessment
+# prompt sent by agent.execute.
+_SUMMARY_MARKER = "## AI Tool Assessment Report"
+_TOOL_PROMPT_PREFIX = "Assess AI tool -"
+
+
+def _replace_link(match: "re.Match[str]") -> str:
+    """Render a Markdown link as a blue ReportLab anchor."""
+    text = match.group(1)  # Group 1 is the visible text
+    url = match.group(2)  # Group 2 is the actual URL
+    return f'<a href="{url}" color="blue">{text}</a>'
+
+
+def _current_text_block(open_tags: List[str]) -> Optional[str]:
+    """Return the block that text at the current position belongs to, if any."""
+    blocks = [tag for tag in open_tags if tag in _TEXT_BLOCK_TAGS]
+    # Paragraphs inside list items or definitions (loose lists) render as the item.
+    for tag in reversed(blocks):
+        if tag != "p":
+            return tag
+    return "p" if blocks else None
+
+
+def _list_depth(open_tags: List[str]) -> int:
+    """Return how many lists enclose the current position."""
+    return sum(1 for tag in open_tags if tag in _LIST_TAGS)
+
+
+def _iter_html_blocks(html: str) -> Iterator[Tuple[Optional[str], str, int]]:
+    """Split python-markdown output into (block tag, inner HTML, list depth) triples.
+
+    Nested blocks are yielded separately, in document order. Empty blocks are skipped
+    and text outside any text block is yielded with a None tag.
+    """
+    open_tags: List[str] = []
+    position = 0
+    for boundary in _HTML_BOUNDARY_RE.finditer(html):
+        content = html[position:boundary.start()].strip()
+        if content:
+            yield _current_text_block(open_tags), content, _list_depth(open_tags)
+        position = boundary.end()
+
+        closing, tag = boundary.groups()
+        if tag == "hr":
+            continue
+        if not closing:
+            open_tags.append(tag)
+        elif tag in open_tags:
+            while open_tags.pop() != tag:
+                pass
+
+    content = html[position:].strip()
+    if content:
+        yield _current_text_block(open_tags), content, _list_depth(open_tags)
+
 
 class PDFService:
     """Service for generating PDF compliance reports."""
     _cache_lock: Lock = Lock()
     _pdf_cache: "OrderedDict[Tuple[str, str], bytes]" = OrderedDict()
     _cache_max_size: int = int(os.getenv("PDF_CACHE_SIZE", "128"))
+    _styles: Optional[StyleSheet1] = None
+    _styles_lock: Lock = Lock()
+    _markdown: Optional[markdown.Markdown] = None
+    # Markdown instances keep per-conversion state, so conversions are serialized.
+    _markdown_lock: Lock = Lock()
+
+    @classmethod
+    def _get_styles(cls) -> StyleSheet1:
+        """Return the custom style sheet, building it once on first use.
+
+        The sheet is only read during doc.build, so one instance is shared by every
+        PDF build, including concurrent ones running in worker threads.
+        """
+        if cls._styles is None:
+            with cls._styles_lock:
+                if cls._styles is None:
+                    cls._styles = cls._create_custom_styles(getSampleStyleSheet())
+        return cls._styles
+
+    @classmethod
+    def _markdown_to_html(cls, markdown_text: str) -> str:
+        """Convert Markdown to HTML with a reused converter instance."""
+        with cls._markdown_lock:
+            if cls._markdown is None:
+                # "extra" minus fenced_code: the agent is instructed never to emit code
+                # blocks, so the fenced-code preprocessor is skipped.
+                cls._markdown = markdown.Markdown(
+                    extensions=[
+                        "abbr",
+                        "attr_list",
+                        "def_list",
+                        "footnotes",
+                        "md_in_html",
+                        "tables",
+                        "nl2br",
+                        "sane_lists",
+                        "smarty",
+                    ]
+                )
+            return cls._markdown.reset().convert(markdown_text)
 
     @classmethod
     def _create_custom_styles(cls, base_styles):
@@ -109,50 +228,61 @@ class PDFService:
         Convert Markdown text to ReportLab Paragraph elements for enhanced formatting.
         """
         try:
+            if "](" in markdown_text:
+                markdown_text = _MARKDOWN_LINK_RE.sub(_replace_link, markdown_text)
 
-            def replace_links(match):
-                text = match.group(1)  # Group 1 is the visible text
-                url = match.group(2)  # Group 2 is the actual URL
-                return f'<a href="{url}" color="blue">{text}</a>'
-
-            markdown_text = re.sub(
-                r"\[([^\]]+)\]\(([^\)]+)\)", replace_links, markdown_text
-            )
-
-            md = markdown.Markdown(
-                extensions=[
-                    "fenced_code",
-                    "extra",
-                    "nl2br",
-                    "sane_lists",
-                    "smarty",
-                ]
-            )
-            html = md.convert(markdown_text)
+            html = cls._markdown_to_html(markdown_text)
             paragraphs = []
-            lines = html.split("\n")
-
-            for line in lines:
-                line = line.strip()
-
-                if line.startswith("<h1"):
-                    line = line.replace("<h1>", "").replace("</h1>", "")
-                    paragraphs.append(Paragraph(line, styles["CustomHeading1"]))
+            # Consecutive list items, table rows or definitions are collected here and
+            # emitted as one Paragraph joined with <br/>, so ReportLab wraps them in a
+            # single pass.
+            run_tag: Optional[str] = None
+            run_lines: List[str] = []
+
+            def flush_run() -> None:
+                if run_lines:
+                    paragraphs.append(Paragraph("<br/>".join(run_lines), styles["CustomNormal"]))
+                    paragraphs.append(Spacer(1, 3))
+                    run_lines.clear()
+
+            for tag, content, list_depth in _iter_html_blocks(html):
+                if tag == "li" and list_depth > 1:
+                    content = _NESTED_LIST_INDENT * (list_depth - 1) + content
+                elif tag == "tr":
+                    content = _TABLE_CELL_BREAK_RE.sub(" | ", content)
+                    content = _TABLE_CELL_TAG_RE.sub("", content).strip()
+                elif tag == "dt":
+                    content = f"<b>{content}</b>"
+
+                if not content:
+                    # Nothing to emit, so there is nothing to space out either.
+                    continue
+
+                run_key = _BATCHED_BLOCK_TAGS.get(tag) if tag else None
+                if run_key is not None:
+                    if run_key != run_tag:
+                        flush_run()
+                        run_tag = run_key
+                    run_lines.append(content)
+                    continue
+
+                flush_run()
+                run_tag = None
+
+                if tag == "h1":
+                    paragraphs.append(Paragraph(content, styles["CustomHeading1"]))
                     paragraphs.append(Spacer(1, 6))
 
-                elif line.startswith("<h2"):
-                    line = line.replace("<h2>", "").replace("</h2>", "")
-                    paragraphs.append(Paragraph(line, styles["CustomHeading2"]))
+                elif tag == "h2":
+                    paragraphs.append(Paragraph(content, styles["CustomHeading2"]))
                     paragraphs.append(Spacer(1, 6))
 
-                elif line:
-                    if line.startswith(("<ul", "<ol", "<pre", "<code")):
-                        paragraphs.append(Paragraph(line, styles["CustomNormal"]))
-                    else:
-                        paragraphs.append(Paragraph(line, styles["CustomNormal"]))
+                else:
+                    paragraphs.append(Paragraph(content, styles["CustomNormal"]))
 
                 paragraphs.append(Spacer(1, 3))
 
+            flush_run()
             return paragraphs
         except Exception as e:
             logger.error(f"Error converting markdown to paragraphs: {e}")
@@ -170,6 +300,25 @@ class PDFService:
         Returns:
             PDF content as bytes.
 
+        Raises:
+            ValueError: If report_content is empty or None.
+            RuntimeError: If PDF generation fails.
+        """
+        pdf_buffer = io.BytesIO()
+        cls.write_pdf(report_content=report_content, ai_tool_name=ai_tool_name, output=pdf_buffer)
+        return pdf_buffer.getvalue()
+
+    @classmethod
+    def write_pdf(cls, report_content: str, ai_tool_name: str, output: BinaryIO) -> None:
+        """
+        Write a PDF document for the compliance report into a binary stream.
+
+        Args:
+            report_content: Markdown formatted compliance report.
+            ai_tool_name: Name of the AI tool being assessed.
+            output: Binary stream to write the PDF into directly, e.g. an open file,
+                so no in-memory copy of the document is made.
+
         Raises:
             ValueError: If report_content is empty or None.
             RuntimeError: If PDF generation fails.
@@ -179,10 +328,8 @@ class PDFService:
 
         logger.info(f"Generating PDF for tool '{ai_tool_name}'")
         try:
-            pdf_buffer = io.BytesIO()
-
             doc = SimpleDocTemplate(
-                pdf_buffer,
+                output,
                 pagesize=letter,
                 rightMargin=inch,
                 leftMargin=inch,
@@ -190,8 +337,7 @@ class PDFService:
                 bottomMargin=0.5 * inch,
             )
 
-            base_styles = getSampleStyleSheet()
-            styles = cls._create_custom_styles(base_styles)
+            styles = cls._get_styles()
 
             story = [
                 Paragraph("EU AI Act Compliance Assessment", styles["CustomTitle"]),
@@ -209,8 +355,6 @@ class PDFService:
             story.extend(cls._convert_markdown_to_paragraphs(report_content, styles))
 
             doc.build(story)
-
-            return pdf_buffer.getvalue()
         except Exception as e:
             logger.error(f"Error generating PDF for tool '{ai_tool_name}': {e}")
             raise RuntimeError(f"Failed to generate PDF: {e}") from e
@@ -251,6 +395,28 @@ class PDFService:
 
         return generated_pdf
 
+    @classmethod
+    async def generate_pdf_cached_async(
+        cls, report_content: str, ai_tool_name: str, session_id: str
+    ) -> bytes:
+        """
+        Run generate_pdf_cached in a worker thread so PDF builds do not block the event loop.
+
+        Args:
+            report_content: Markdown formatted compliance report.
+            ai_tool_name: Name of the AI tool being assessed.
+            session_id: Session identifier used to scope cache entries.
+
+        Returns:
+            PDF content as bytes.
+        """
+        return await asyncio.to_thread(
+            cls.generate_pdf_cached,
+            report_content=report_content,
+            ai_tool_name=ai_tool_name,
+            session_id=session_id,
+        )
+
 
 async def get_report_for_session(
     session_id: str, user_email: Optional[str] = None
@@ -274,8 +440,7 @@ async def get_report_for_session(
             logger.warning(f"No session found for session_id: {session_id}")
             return None
 
-        ai_tool_name = _extract_ai_tool_name(session)
-        summary = _extract_summary(session)
+        ai_tool_name, summary = _extract_report_fields(session)
 
         logger.info(f"Report retrieved for session {session_id}")
         return {"summary": summary, "ai_tool": ai_tool_name}
@@ -284,53 +449,51 @@ async def get_report_for_session(
         return None
 
 
-def _extract_ai_tool_name(session) -> str:
-    """
-    Extract the AI tool name from session data.
-
-    Args:
-        session: Session object from the database.
-
-    Returns:
-        AI tool name or 'Unknown AI Tool' if not found.
+def _extract_report_fields(session) -> Tuple[str, str]:
     """
-    if hasattr(session, "state") and session.state:
-        if "ai_tool" in session.state:
-            return session.state["ai_tool"]
-
-    if hasattr(session, "events") and session.events:
-        for event in session.events:
-            if hasattr(event, "content") and event.content:
-                parts = getattr(event.content, "parts", [])
-                for part in parts:
-                    text = getattr(part, "text", "")
-                    if text and "Assess AI tool -" in text:
-                        return text.replace("Assess AI tool -", "").strip()
+    Extract the AI tool name and summary report from session data in one pass.
 
-    return "Unknown AI Tool"
-
-
-def _extract_summary(session) -> str:
-    """
-    Extract the summary report from session data.
+    Session state wins when present. Otherwise events are walked once in reverse:
+    the summary is the latest report event, the tool name comes from the earliest
+    "Assess AI tool -" prompt.
 
     Args:
         session: Session object from the database.
 
     Returns:
-        Summary text or empty string if not found.
+        Tuple of (AI tool name or 'Unknown AI Tool', summary text or empty string).
     """
-    if hasattr(session, "state") and session.state:
-        if "summary" in session.state:
-            return session.state["summary"]
-
-    if hasattr(session, "events") and session.events:
-        for event in reversed(session.events):
-            if hasattr(event, "content") and event.content:
-                parts = getattr(event.content, "parts", [])
-                for part in parts:
-                    text = getattr(part, "text", "")
-                    if text and "## AI Tool Assessment Report" in text:
-                        return text
-
-    return ""
+    state = getattr(session, "state", None) or {}
+    ai_tool_name: Optional[str] = state.get("ai_tool")
+    summary: Optional[str] = state.get("summary")
+    need_tool = ai_tool_name is None
+    need_summary = summary is None
+
+    events = getattr(session, "events", None)
+    if (need_tool or need_summary) and events:
+        for event in reversed(events):
+            content = getattr(event, "content", None)
+            if not content:
+                continue
+
+            event_tool_name: Optional[str] = None
+            for part in getattr(content, "parts", None) or ():
+                text = getattr(part, "text", None)
+                if not text:
+                    continue
+                if need_summary and summary is None and _SUMMARY_MARKER in text:
+                    summary = text
+                if need_tool and event_tool_name is None and text.startswith(_TOOL_PROMPT_PREFIX):
+                    event_tool_name = text[len(_TOOL_PROMPT_PREFIX):].strip()
+
+            if event_tool_name is not None:
+                # Keep overwriting while walking backwards so the earliest prompt wins.
+                ai_tool_name = event_tool_name
+            elif not need_tool and summary is not None:
+                break
+
+    if ai_tool_name is None:
+        ai_tool_name = "Unknown AI Tool"
+    if summary is None:
+        summary = ""
+    return ai_tool_name, summary
@@ -7,6 +7,11 @@ compliance information about AI tools.
 
 import json
 import logging
+import os
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Optional, Tuple
 
 from dotenv import load_dotenv
 from google.adk.tools.function_tool import FunctionTool
@@ -20,6 +25,12 @@ load_dotenv()
 logger = logging.getLogger(__name__)
 _search_provider = None
 
+_SEARCH_MAX_RESULTS = 5
+_search_cache_ttl_seconds = float(os.getenv("SEARCH_CACHE_TTL_SECONDS", "900"))
+_search_cache_max_size = int(os.getenv("SEARCH_CACHE_SIZE", "512"))
+_search_cache: "OrderedDict[Tuple[str, str, int], Tuple[str, float]]" = OrderedDict()
+_search_cache_lock = Lock()
+
 
 def _get_search_provider():
     """
@@ -34,6 +45,35 @@ def _get_search_provider():
     return _search_provider
 
 
+def _search_cache_key(provider_name: str, query: str) -> Tuple[str, str, int]:
+    """Build the cache key; casing and whitespace differences map to one entry."""
+    return provider_name, " ".join(query.lower().split()), _SEARCH_MAX_RESULTS
+
+
+def _get_cached_response(key: Tuple[str, str, int]) -> Optional[str]:
+    """Return a cached tool response that has not expired yet."""
+    with _search_cache_lock:
+        entry = _search_cache.get(key)
+        if entry is None:
+            return None
+
+        response, cached_at = entry
+        if time.monotonic() - cached_at > _search_cache_ttl_seconds:
+            _search_cache.pop(key, None)
+            return None
+
+        _search_cache.move_to_end(key)
+        return response
+
+
+def _cache_response(key: Tuple[str, str, int], response: str) -> None:
+    with _search_cache_lock:
+        _search_cache[key] = (response, time.monotonic())
+        _search_cache.move_to_end(key)
+        while len(_search_cache) > _search_cache_max_size:
+            _search_cache.popitem(last=False)
+
+
 def deep_compliance_search(query: str) -> str:
     """
     Conducts a targeted web search for AI tool metadata.
@@ -53,16 +93,28 @@ def deep_compliance_search(query: str) -> str:
 
     try:
         provider = _get_search_provider()
-        results = provider.search(query, max_results=5)
+        cache_key = _search_cache_key(provider.name, query)
+        cached_response = _get_cached_response(cache_key)
+        if cached_response is not None:
+            logger.info(f"Search cache hit for: {query}")
+            return cached_response
+
+        results = provider.search(query, max_results=_SEARCH_MAX_RESULTS)
 
         if not results:
             logger.info(f"No results found for: {query}")
-            return "No specific results found for this query."
-
-        structured_data = [result.to_dict() for result in results]
-
-        logger.info(f"Found {len(structured_data)} results.")
-        return json.dumps(structured_data, indent=2)
+            response = "No specific results found for this query."
+        else:
+            structured_data = [result.to_dict() for result in results]
+            logger.info(f"Found {len(structured_data)} results.")
+            # No indent: indented output bypasses the C encoder, and the LLM does not
+            # need pretty-printed JSON.
+            response = json.dumps(structured_data)
+
+        # Only successful lookups are cached; provider errors fall through to the
+        # except blocks below and are retried on the next call.
+        _cache_response(cache_key, response)
+        return response
 
     except SearchProviderError as e:
         logger.error(f"Search provider error: {str(e)}")
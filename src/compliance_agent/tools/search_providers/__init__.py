@@ -25,6 +25,7 @@ from compliance_agent.tools.search_providers.factory import (
     ProviderType,
     create_search_provider,
     get_available_providers,
+    reset_search_providers,
 )
 from compliance_agent.tools.search_providers.serpapi import SerpAPIProvider
 from compliance_agent.tools.search_providers.serper import GoogleSerperProvider
@@ -36,6 +37,7 @@ __all__ = [
     "ProviderType",
     "create_search_provider",
     "get_available_providers",
+    "reset_search_providers",
     "SerpAPIProvider",
     "GoogleSerperProvider",
 ]
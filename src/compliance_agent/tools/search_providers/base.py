@@ -5,12 +5,14 @@ This module defines the interface that all search providers must implement,
 enabling extensibility and consistent behavior across different search APIs.
 """
 
+import re
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import List, Optional
+from functools import lru_cache
+from typing import List, Optional, Tuple
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchResult:
     """
     Represents a single search result with structured data.
@@ -37,6 +39,12 @@ class SearchResult:
         }
 
 
+@lru_cache(maxsize=None)
+def _compile_domain_patterns(domains: Tuple[str, ...]) -> "re.Pattern[str]":
+    """Compile domain substrings into one case-insensitive alternation."""
+    return re.compile("|".join(re.escape(domain) for domain in domains), re.IGNORECASE)
+
+
 class SearchProvider(ABC):
     """
     Abstract base class for search providers.
@@ -82,7 +90,7 @@ class SearchProvider(ABC):
 
     def _classify_source(self, url: str) -> str:
         """
-        Classify a URL as Official/Primary or Secondary based on domain patterns.
+        Classify a URL as Official/Primary or Secondary based on its host name.
 
         Args:
             url: The URL to classify.
@@ -91,8 +99,10 @@ class SearchProvider(ABC):
             "Official/Primary" if the URL matches primary domain patterns,
             otherwise "Secondary".
         """
-        url_lower = url.lower()
-        if any(domain in url_lower for domain in self.PRIMARY_DOMAINS):
+        # Only the host is scanned: "docs." in a path or query string says nothing
+        # about who publishes the page.
+        host = url.split("/", 3)[2] if "://" in url else url
+        if _compile_domain_patterns(self.PRIMARY_DOMAINS).search(host):
             return "Official/Primary"
         return "Secondary"
 
@@ -113,18 +123,16 @@ class SearchProvider(ABC):
         raw_results = self._execute_search(query)
         organic = self._extract_organic_results(raw_results)
 
-        results = []
-        for result in organic[:max_results]:
-            link = result.get("link", "")
-            search_result = SearchResult(
+        classify = self._classify_source
+        return [
+            SearchResult(
                 title=result.get("title", ""),
-                link=link,
+                link=(link := result.get("link", "")),
                 snippet=result.get("snippet", ""),
-                source_type=self._classify_source(link),
+                source_type=classify(link),
             )
-            results.append(search_result)
-
-        return results
+            for result in organic[:max_results]
+        ]
 
 
 class SearchProviderError(Exception):
@@ -8,7 +8,8 @@ API keys in the environment.
 import logging
 import os
 from enum import Enum
-from typing import Optional
+from threading import Lock
+from typing import Dict, Optional, Tuple
 
 from compliance_agent.tools.search_providers.base import (
     SearchProvider,
@@ -27,6 +28,10 @@ class ProviderType(Enum):
     SERPAPI = "serpapi"
 
 
+_provider_instances: Dict[ProviderType, SearchProvider] = {}
+_provider_lock = Lock()
+
+
 def create_search_provider(
         provider_type: Optional[ProviderType] = None,
 ) -> SearchProvider:
@@ -38,6 +43,9 @@ def create_search_provider(
     1. SERPER_API_KEY -> GoogleSerperProvider
     2. SERPAPI_API_KEY -> SerpAPIProvider
 
+    One instance is kept per provider type for the lifetime of the process,
+    so repeated calls reuse the same API wrapper.
+
     Args:
         provider_type: Optional explicit provider type to use.
 
@@ -48,6 +56,29 @@ def create_search_provider(
         SearchProviderError: If no valid API key is found or provider
             initialization fails.
     """
+    resolved_type, api_key = _resolve_provider(provider_type)
+
+    provider = _provider_instances.get(resolved_type)
+    if provider is None:
+        with _provider_lock:
+            provider = _provider_instances.get(resolved_type)
+            if provider is None:
+                provider = _construct_provider(resolved_type, api_key)
+                _provider_instances[resolved_type] = provider
+                logger.info(f"Created {provider.name} search provider.")
+    return provider
+
+
+def reset_search_providers() -> None:
+    """Drop cached provider instances, e.g. after API keys change or between tests."""
+    with _provider_lock:
+        _provider_instances.clear()
+
+
+def _resolve_provider(
+        provider_type: Optional[ProviderType],
+) -> Tuple[ProviderType, str]:
+    """Pick the provider type to use and return it with its API key."""
     serper_api_key = os.environ.get("SERPER_API_KEY", "")
     serpapi_api_key = os.environ.get("SERPAPI_API_KEY", "")
 
@@ -57,8 +88,8 @@ def create_search_provider(
                 "Factory",
                 "SERPER_API_KEY environment variable is not set.",
             )
-        logger.info("Creating GoogleSerper provider (explicitly requested).")
-        return GoogleSerperProvider(api_key=serper_api_key)
+        logger.debug("Using GoogleSerper provider (explicitly requested).")
+        return ProviderType.SERPER, serper_api_key
 
     if provider_type == ProviderType.SERPAPI:
         if not serpapi_api_key:
@@ -66,16 +97,16 @@ def create_search_provider(
                 "Factory",
                 "SERPAPI_API_KEY environment variable is not set.",
             )
-        logger.info("Creating SerpAPI provider (explicitly requested).")
-        return SerpAPIProvider(api_key=serpapi_api_key)
+        logger.debug("Using SerpAPI provider (explicitly requested).")
+        return ProviderType.SERPAPI, serpapi_api_key
 
     if serper_api_key:
-        logger.info("Auto-selected GoogleSerper provider (SERPER_API_KEY found).")
-        return GoogleSerperProvider(api_key=serper_api_key)
+        logger.debug("Auto-selected GoogleSerper provider (SERPER_API_KEY found).")
+        return ProviderType.SERPER, serper_api_key
 
     if serpapi_api_key:
-        logger.info("Auto-selected SerpAPI provider (SERPAPI_API_KEY found).")
-        return SerpAPIProvider(api_key=serpapi_api_key)
+        logger.debug("Auto-selected SerpAPI provider (SERPAPI_API_KEY found).")
+        return ProviderType.SERPAPI, serpapi_api_key
 
     raise SearchProviderError(
         "Factory",
@@ -83,6 +114,13 @@ def create_search_provider(
     )
 
 
+def _construct_provider(provider_type: ProviderType, api_key: str) -> SearchProvider:
+    """Instantiate the provider class for the given type."""
+    if provider_type == ProviderType.SERPER:
+        return GoogleSerperProvider(api_key=api_key)
+    return SerpAPIProvider(api_key=api_key)
+
+
 def get_available_providers() -> list[ProviderType]:
     """
     Return a list of provider types that have valid API keys configured.
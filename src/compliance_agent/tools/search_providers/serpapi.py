@@ -6,8 +6,6 @@ This module provides a search provider that uses SerpAPI for web searches.
 
 from typing import List
 
-from langchain_community.utilities import SerpAPIWrapper
-
 from compliance_agent.tools.search_providers.base import (
     SearchProvider,
     SearchProviderError,
@@ -34,6 +32,9 @@ class SerpAPIProvider(SearchProvider):
                 self.name,
                 "API key is required but was not provided.",
             )
+        # Deferred like in GoogleSerperProvider: only pay for the import when selected.
+        from langchain_community.utilities import SerpAPIWrapper
+
         self._wrapper = SerpAPIWrapper(serpapi_api_key=api_key)
 
     @property
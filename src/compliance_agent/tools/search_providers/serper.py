@@ -6,8 +6,6 @@ This module provides a search provider that uses Google Serper API for web searc
 
 from typing import List
 
-from langchain_community.utilities import GoogleSerperAPIWrapper
-
 from compliance_agent.tools.search_providers.base import (
     SearchProvider,
     SearchProviderError,
@@ -34,6 +32,10 @@ class GoogleSerperProvider(SearchProvider):
                 self.name,
                 "API key is required but was not provided.",
             )
+        # Imported here so langchain_community is only loaded once a provider is
+        # actually built (it adds several hundred ms to import time).
+        from langchain_community.utilities import GoogleSerperAPIWrapper
+
         self._wrapper = GoogleSerperAPIWrapper(serper_api_key=api_key)
 
     @property
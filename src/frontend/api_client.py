@@ -5,6 +5,8 @@ from typing import Any, Dict, List, Optional, TypedDict
 
 import requests
 import streamlit as st
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from compliance_agent.api.models import AssessRequest
 from frontend.auth import get_auth_headers
@@ -56,20 +58,47 @@ logger = logging.getLogger(__name__)
 
 API_URL = os.getenv("API_URL", "http://localhost:8000")
 BACKEND_UNAVAILABLE_MESSAGE = "Internal server error."
-_HTTP_SESSION = requests.Session()
+# Session-state entries tied to the signed-in user; dropped when the token expires.
+_AUTH_SCOPED_STATE_KEYS = ("initialized", "billing_state")
+# (connect, read) timeouts. Assessments run the agent end to end, so /run has no read
+# timeout; PDF rendering gets more headroom than the quick JSON endpoints.
+_DEFAULT_TIMEOUT = (3.05, 30)
+_RUN_TIMEOUT = (3.05, None)
+_PDF_TIMEOUT = (3.05, 120)
+
+
+def _build_http_session() -> requests.Session:
+    """Create the pooled session shared by all backend calls."""
+    session = requests.Session()
+    # Retry's default allowed methods exclude POST, so assessments are never replayed.
+    # Only connect errors and gateway statuses are retried: a read timeout means the
+    # backend is still working on the request, and a retry would only stack another
+    # full timeout (and, for /pdf, another build) on top of it.
+    retries = Retry(
+        total=2,
+        read=0,
+        other=0,
+        backoff_factor=0.2,
+        status_forcelist=(502, 503, 504),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retries)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+_HTTP_SESSION = _build_http_session()
 
 
 def _headers() -> Dict[str, str]:
     return get_auth_headers()
 
 
-def _handle_unauthorized(response: requests.Response) -> None:
-    """Force re-authentication when the backend rejects the bearer token."""
-    if response.status_code != 401:
-        return
-
-    st.session_state.pop("initialized", None)
-    st.session_state.pop("billing_state", None)
+def _handle_unauthorized() -> None:
+    """Force re-authentication after the backend rejected the bearer token."""
+    for key in _AUTH_SCOPED_STATE_KEYS:
+        st.session_state.pop(key, None)
     st.error("Your sign-in token expired. Please log in again.")
     st.logout()
     st.rerun()
@@ -90,6 +119,7 @@ def _mark_backend_available() -> None:
 def _request(method: str, url: str, **kwargs: Any) -> Optional[requests.Response]:
     """Execute an HTTP request and centralize auth failure handling."""
     logger.info(f"Sending {method} request to {url} with args: {kwargs.get('params')}")
+    kwargs.setdefault("timeout", _DEFAULT_TIMEOUT)
     start = time.perf_counter()
     try:
         response = _HTTP_SESSION.request(method, url, **kwargs)
@@ -113,7 +143,8 @@ def _request(method: str, url: str, **kwargs: Any) -> Optional[requests.Response
         elapsed_ms,
     )
     _mark_backend_available()
-    _handle_unauthorized(response)
+    if response.status_code == 401:
+        _handle_unauthorized()
     return response
 
 
@@ -195,7 +226,13 @@ def delete_session_by_id_and_email(session_id: str, email: str) -> bool:
 
 def run_assessment(payload: AssessRequest) -> requests.Response:
     """Run a compliance assessment for the specified AI tool."""
-    response = _request("POST", f"{API_URL}/run", json=payload, headers=_headers())
+    response = _request(
+        "POST",
+        f"{API_URL}/run",
+        json=payload,
+        headers=_headers(),
+        timeout=_RUN_TIMEOUT,
+    )
     if response is None:
         raise RuntimeError(BACKEND_UNAVAILABLE_MESSAGE)
     return response
@@ -208,6 +245,7 @@ def generate_pdf(session_id: str, email: str) -> requests.Response:
         f"{API_URL}/pdf",
         params={"session_id": session_id, "user_email": email},
         headers=_headers(),
+        timeout=_PDF_TIMEOUT,
     )
     if response is None:
         raise RuntimeError(BACKEND_UNAVAILABLE_MESSAGE)
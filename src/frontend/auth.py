@@ -10,6 +10,17 @@ _EMBEDDED_BROWSER_SIGNALS = (
     "MicroMessenger",  # WeChat
 )
 
+_EMBEDDED_BROWSER_TITLE_HTML = (
+    "<h1 style='text-align: center; margin-top: 50px;'>EU AI Act Compliance Agent</h1>"
+)
+_LOGIN_TITLE_HTML = (
+    "<h1 style='text-align: center; margin-top: 50px; max-width: 800px;'>EU AI Act Compliance Agent</h1>"
+)
+_LOGIN_BODY_HTML = (
+    "<p style='text-align: center; max-width: 800px;'>To start AI tool assessment,"
+    " please authenticate with your Google Workspace account.</p>"
+)
+
 
 def _is_embedded_browser() -> bool:
     """Return True if the request comes from a known embedded/in-app WebView."""
@@ -23,10 +34,7 @@ def _is_embedded_browser() -> bool:
 def require_login():
     """Handles Google Workspace authentication."""
     if _is_embedded_browser():
-        st.markdown(
-            "<h1 style='text-align: center; margin-top: 50px;'>EU AI Act Compliance Agent</h1>",
-            unsafe_allow_html=True,
-        )
+        st.markdown(_EMBEDDED_BROWSER_TITLE_HTML, unsafe_allow_html=True)
         st.info(
             "Google sign-in is not supported inside in-app browsers (e.g. LinkedIn, Facebook).\n\n"
             "Please open this link in your device's default browser (Chrome, Safari, Firefox, etc.) "
@@ -39,15 +47,8 @@ def require_login():
         if st.query_params.get("auto_login") == "true":
             st.login()
         else:
-            st.markdown(
-                "<h1 style='text-align: center; margin-top: 50px; max-width: 800px;'>EU AI Act Compliance Agent</h1>",
-                unsafe_allow_html=True,
-            )
-            st.markdown(
-                "<p style='text-align: center; max-width: 800px;'>To start AI tool assessment,"
-                " please authenticate with your Google Workspace account.</p>",
-                unsafe_allow_html=True,
-            )
+            st.markdown(_LOGIN_TITLE_HTML, unsafe_allow_html=True)
+            st.markdown(_LOGIN_BODY_HTML, unsafe_allow_html=True)
             left_co, cent_co, last_co = st.columns([1, 1, 1])
             with cent_co:
                 if st.button("Log in with Google", use_container_width=True):
@@ -5,25 +5,50 @@ import streamlit as st
 from compliance_agent.config import DISCLAIMER_TEXT
 from frontend import fetch_billing_state, generate_pdf, run_assessment
 
+MAIN_CONTENT_CSS = """
+    <style>
+        [data-testid="stElementContainer"] [data-testid="stMarkdownContainer"] p strong a {
+            color: black !important;
+            font-weight: bold;
+        }
+    </style>
+    """
+
+
+class _FilenameCharMap(dict):
+    """str.translate table: keep alphanumerics, space, '-' and '_', replace the rest.
+
+    Entries are computed on first sight of a code point, so non-ASCII letters are
+    handled like str.isalnum() does while repeat lookups stay at C speed.
+    """
+
+    def __missing__(self, code_point: int) -> str:
+        char = chr(code_point)
+        replacement = char if char.isalnum() or char in " -_" else "_"
+        self[code_point] = replacement
+        return replacement
+
+
+_FILENAME_CHAR_MAP = _FilenameCharMap()
+
+
+def _safe_filename(tool_name: str) -> str:
+    """Make an AI tool name safe to use inside a download file name."""
+    return tool_name.translate(_FILENAME_CHAR_MAP)
+
+
 def render_main_content():
     if "assessment_in_progress" not in st.session_state:
         st.session_state.assessment_in_progress = False
     if "pending_assessment_payload" not in st.session_state:
         st.session_state.pending_assessment_payload = None
 
-    st.markdown(
-        """
-        <style>
-            [data-testid="stElementContainer"] [data-testid="stMarkdownContainer"] p strong a {
-                color: black !important;
-                font-weight: bold;
-            }
-        </style>
-        """,
-        unsafe_allow_html=True,
-    )
+    # Re-emitted on every rerun; see SIDEBAR_CSS in frontend.sidebar.
+    st.markdown(MAIN_CONTENT_CSS, unsafe_allow_html=True)
 
-    st.markdown(f"Welcome, **{st.user.name}** - (**{st.user.email}**)")
+    user = st.user
+    user_email = user.email
+    st.markdown(f"Welcome, **{user.name}** - (**{user_email}**)")
     st.title("AI Tool Assessment Agent")
 
     billing_state = st.session_state.get("billing_state")
@@ -45,24 +70,30 @@ def render_main_content():
         input_placeholder = "e.g. Notion AI"
         input_value = ""
 
-    user_input = st.text_area(
-        input_label,
-        value=input_value,
-        placeholder=input_placeholder,
-        key=f"input_{st.session_state.session_id}",
-    )
-
     can_submit = credits_left_today is not None and credits_left_today > 0
-    if credits_left_today == 0:
-        st.warning("Daily limit reached (20/20). Try again after the UTC reset.")
-    elif credits_left_today is None:
-        if st.session_state.get("backend_unavailable", False):
-            st.warning("Daily credits are unavailable because the backend API is offline.")
-        else:
-            st.warning("Could not load daily credits. Please refresh balance and try again.")
-
     submit_disabled = (not can_submit) or is_processing
-    if st.button("Submit", disabled=submit_disabled):
+
+    # A form keeps edits in the text area from rerunning the whole page; the script
+    # only reruns when Submit is pressed.
+    with st.form(key="assessment_form", border=False):
+        user_input = st.text_area(
+            input_label,
+            value=input_value,
+            placeholder=input_placeholder,
+            key=f"input_{st.session_state.session_id}",
+        )
+
+        if credits_left_today == 0:
+            st.warning("Daily limit reached (20/20). Try again after the UTC reset.")
+        elif credits_left_today is None:
+            if st.session_state.get("backend_unavailable", False):
+                st.warning("Daily credits are unavailable because the backend API is offline.")
+            else:
+                st.warning("Could not load daily credits. Please refresh balance and try again.")
+
+        submitted = st.form_submit_button("Submit", disabled=submit_disabled)
+
+    if submitted:
         if not user_input:
             st.warning("Please fill in the name of the AI tool to assess.")
         else:
@@ -70,7 +101,7 @@ def render_main_content():
                 "ai_tool": user_input,
                 "session_id": st.session_state.session_id,
                 "request_id": str(uuid.uuid4()),
-                "user_email": st.user.email,
+                "user_email": user_email,
             }
             st.session_state.assessment_in_progress = True
             st.rerun()
@@ -95,7 +126,10 @@ def render_main_content():
                 if not is_active_session:
                     st.session_state.ai_tool_name = pending_payload["ai_tool"]
 
-                st.session_state.billing_state = fetch_billing_state()
+                billing_state = res_json.get("billing")
+                st.session_state.billing_state = (
+                    billing_state if billing_state is not None else fetch_billing_state()
+                )
                 st.session_state.history_needs_refresh = True
                 st.session_state.pdf_data = None
                 st.rerun()
@@ -113,25 +147,29 @@ def render_main_content():
         st.info(DISCLAIMER_TEXT, icon=":material/gavel:")
 
         try:
-            with st.spinner("Generating PDF..."):
-                pdf_response = generate_pdf(st.session_state.session_id, st.user.email)
-
-                if pdf_response.ok:
-                    tool_name = st.session_state.ai_tool_name or "unknown"
-                    safe_filename = "".join(
-                        c if c.isalnum() or c in (" ", "-", "_") else "_" for c in tool_name
-                    )
-
-                    st.download_button(
-                        label="Download Compliance Assessment PDF",
-                        data=pdf_response.content,
-                        file_name=f"ai_tool_assessment_{safe_filename}.pdf",
-                        mime="application/pdf",
-                        key="pdf_download",
-                        help="Click to download the PDF report of the AI tool compliance assessment",
-                    )
-                else:
-                    st.error(f"Failed to generate PDF: {pdf_response.status_code}")
+            # pdf_data is reset whenever the report changes, so the PDF is transferred
+            # once per report instead of on every rerun.
+            if st.session_state.pdf_data is None:
+                with st.spinner("Generating PDF..."):
+                    pdf_response = generate_pdf(st.session_state.session_id, user_email)
+
+                    if pdf_response.ok:
+                        st.session_state.pdf_data = pdf_response.content
+                    else:
+                        st.error(f"Failed to generate PDF: {pdf_response.status_code}")
+
+            if st.session_state.pdf_data is not None:
+                tool_name = st.session_state.ai_tool_name or "unknown"
+                safe_filename = _safe_filename(tool_name)
+
+                st.download_button(
+                    label="Download Compliance Assessment PDF",
+                    data=st.session_state.pdf_data,
+                    file_name=f"ai_tool_assessment_{safe_filename}.pdf",
+                    mime="application/pdf",
+                    key="pdf_download",
+                    help="Click to download the PDF report of the AI tool compliance assessment",
+                )
 
         except RuntimeError as exc:
             st.warning(str(exc))
@@ -1,5 +1,6 @@
 import uuid
 from datetime import datetime, timezone
+from functools import lru_cache
 from urllib.parse import urlparse
 
 import streamlit as st
@@ -13,6 +14,36 @@ from frontend.api_client import (
 
 ABOUT_EU_AI_ACT_PATH = "/about-eu-ai-act"
 INTERNAL_API_HOSTNAMES = {"backend"}
+SIDEBAR_CSS = """
+    <style>
+        [data-testid="stSidebarHeader"] {
+            display: flex;
+            -webkit-box-pack: justify;
+            justify-content: space-between;
+            -webkit-box-align: center;
+            margin-top: 1rem;
+            margin-bottom: 0;
+            height: 0;
+        }
+        [data-testid="stSidebar"] [data-testid="stVerticalBlock"] > div:last-child {
+            margin-top: auto;
+        }
+        [data-testid="stSidebar"]  [data-testid="stSidebarUserContent"] {
+            padding-bottom: 1rem;
+        }
+        [data-testid="stSidebar"] [data-testid="stMarkdownContainer"] hr {
+            margin: 1em 0;
+        }
+        [data-testid="stSidebar"] [data-testid="stMarkdownContainer"] p {
+            margin-bottom: 0;
+        }
+        section[data-testid="stSidebar"] a {
+            color: black !important;
+            font-weight: bold;
+        }
+    </style>
+    """
+LEGACY_CREATED_AT_FORMAT = "%b %d, %I:%M %p"
 
 
 def _build_about_eu_ai_act_url(api_url: str) -> str:
@@ -33,9 +64,12 @@ def _build_about_eu_ai_act_url(api_url: str) -> str:
     return f"{api_url.rstrip('/')}{ABOUT_EU_AI_ACT_PATH}"
 
 
+@lru_cache(maxsize=512)
 def _format_assessment_created_at(created_at: str) -> str:
     """Format assessment timestamp for display in UTC without conversion.
 
+    Memoized: the history list renders the same timestamps on every rerun.
+
     Args:
         created_at: Timestamp from backend session metadata.
 
@@ -56,46 +90,18 @@ def _format_assessment_created_at(created_at: str) -> str:
 
     # Legacy API format fallback: "Mar 04, 07:30 PM" (already UTC in this app).
     try:
-        datetime.strptime(created_at, "%b %d, %I:%M %p")
+        datetime.strptime(created_at, LEGACY_CREATED_AT_FORMAT)
         return f"{created_at} UTC"
     except ValueError:
         return created_at
 
 
 def render_sidebar():
+    user_email = st.user.email
     with st.sidebar:
-        st.markdown(
-            """
-            <style>
-                [data-testid="stSidebarHeader"] {
-                    display: flex;
-                    -webkit-box-pack: justify;
-                    justify-content: space-between;
-                    -webkit-box-align: center;
-                    margin-top: 1rem;
-                    margin-bottom: 0;
-                    height: 0;
-                }
-                [data-testid="stSidebar"] [data-testid="stVerticalBlock"] > div:last-child {
-                    margin-top: auto;
-                }
-                [data-testid="stSidebar"]  [data-testid="stSidebarUserContent"] {
-                    padding-bottom: 1rem;
-                }
-                [data-testid="stSidebar"] [data-testid="stMarkdownContainer"] hr {
-                    margin: 1em 0;
-                }
-                [data-testid="stSidebar"] [data-testid="stMarkdownContainer"] p {
-                    margin-bottom: 0;
-                }
-                section[data-testid="stSidebar"] a {
-                    color: black !important;
-                    font-weight: bold;
-                }
-            </style>
-            """,
-            unsafe_allow_html=True,
-        )
+        # Streamlit drops elements that a rerun does not emit again, so the style block
+        # has to be written on every run.
+        st.markdown(SIDEBAR_CSS, unsafe_allow_html=True)
 
         with st.container():
             if st.button("Log out", use_container_width=True):
@@ -131,7 +137,7 @@ def render_sidebar():
             st.rerun()
 
         if st.session_state.get("history_needs_refresh", True):
-            st.session_state.history_cache = fetch_session_history(st.user.email)
+            st.session_state.history_cache = fetch_session_history(user_email)
             st.session_state.history_needs_refresh = False
 
         history = st.session_state.get("history_cache", [])
@@ -154,7 +160,7 @@ def render_sidebar():
                             key=f"load_{session_id}",
                             use_container_width=True,
                     ):
-                        fetch_session_by_id_and_email(session_id, st.user.email)
+                        fetch_session_by_id_and_email(session_id, user_email)
                         st.rerun()
                 with delete_col:
                     with st.popover("", icon=":material/more_horiz:", use_container_width=True):
@@ -164,7 +170,7 @@ def render_sidebar():
                                 key=f"delete_{session_id}",
                                 use_container_width=True,
                         ):
-                            deleted = delete_session_by_id_and_email(session_id, st.user.email)
+                            deleted = delete_session_by_id_and_email(session_id, user_email)
                             if deleted and st.session_state.session_id == session_id:
                                 st.session_state.session_id = str(uuid.uuid4())
                                 st.session_state.ai_tool_name = None
@@ -67,6 +67,57 @@ def test_run_returns_credits_left_today(monkeypatch) -> None:
     assert payload["session_id"] == "session-1"
     assert payload["credits_left_today"] == 4
     assert payload["billing_status"] == "ok"
+    assert payload["billing"] == {
+        "daily_limit": 20,
+        "used_today": 16,
+        "credits_left_today": 4,
+        "can_run_request": True,
+        "resets_at_utc": "2026-02-24T00:00:00+00:00",
+    }
+
+
+class _CountingAgent:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def execute(self, payload: object) -> dict[str, str]:
+        self.calls += 1
+        return {"summary": f"run {self.calls}", "session_id": "session-1"}
+
+
+def test_run_reuses_result_for_duplicate_request_id(monkeypatch) -> None:
+    """Resubmitting the same request_id should not execute the agent again."""
+    agent = _CountingAgent()
+    client = _build_client(monkeypatch=monkeypatch, agent=agent)
+    body = {"ai_tool": "Notion AI", "request_id": "req-1"}
+
+    first = client.post("/run", json=body)
+    second = client.post("/run", json=body)
+    third = client.post("/run", json={"ai_tool": "Notion AI", "request_id": "req-2"})
+
+    assert first.json()["summary"] == "run 1"
+    assert second.json() == first.json()
+    assert third.json()["summary"] == "run 2"
+    assert agent.calls == 2
+
+
+class _FailsOnceAgent(_CountingAgent):
+    async def execute(self, payload: object) -> dict[str, str]:
+        if self.calls == 0:
+            self.calls += 1
+            raise InsufficientCreditsError("Daily limit reached.")
+        return await super().execute(payload)
+
+
+def test_run_retries_after_failed_duplicate(monkeypatch) -> None:
+    """A request_id whose run failed should execute again on resubmission."""
+    agent = _FailsOnceAgent()
+    client = _build_client(monkeypatch=monkeypatch, agent=agent)
+    body = {"ai_tool": "Notion AI", "request_id": "req-1"}
+
+    assert client.post("/run", json=body).status_code == 402
+    assert client.post("/run", json=body).status_code == 200
+    assert agent.calls == 2
 
 
 def test_run_returns_402_for_daily_limit(monkeypatch) -> None:
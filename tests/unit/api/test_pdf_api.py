@@ -0,0 +1,69 @@
+from typing import Optional
+
+from fastapi.testclient import TestClient
+
+import compliance_agent.api.app as app_module
+from compliance_agent.api.app import create_app
+from compliance_agent.billing import AuthenticatedUser, get_authenticated_user
+
+
+class _NoBillingService:
+    def is_enabled(self) -> bool:
+        return False
+
+
+class _DummyAgent:
+    async def execute(self, payload: object):
+        return {"summary": "ok", "session_id": "session-1"}
+
+
+def _build_client(monkeypatch, report: Optional[dict]) -> TestClient:
+    async def _fake_get_report_for_session(session_id: str, user_email: Optional[str] = None):
+        return report
+
+    monkeypatch.setattr(app_module, "BillingService", _NoBillingService)
+    monkeypatch.setattr(app_module, "get_report_for_session", _fake_get_report_for_session)
+
+    app = create_app(agent=_DummyAgent())
+    app.dependency_overrides[get_authenticated_user] = lambda: AuthenticatedUser(
+        subject="google-sub-1",
+        email="user@example.com",
+    )
+    return TestClient(app)
+
+
+def test_pdf_returns_attachment_for_existing_report(monkeypatch) -> None:
+    """PDF endpoint should return a generated PDF with a sanitized filename."""
+    client = _build_client(
+        monkeypatch=monkeypatch,
+        report={"summary": "## AI Tool Assessment Report\nAll good.", "ai_tool": "Notion/AI"},
+    )
+
+    response = client.get("/pdf", params={"session_id": "session-pdf-1"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/pdf"
+    assert (
+        response.headers["content-disposition"]
+        == 'attachment; filename="ai_tool_assessment_Notion_AI.pdf"'
+    )
+    assert response.content.startswith(b"%PDF")
+    assert int(response.headers["content-length"]) == len(response.content)
+
+
+def test_pdf_returns_404_when_report_missing(monkeypatch) -> None:
+    """PDF endpoint should return 404 when the session has no report."""
+    client = _build_client(monkeypatch=monkeypatch, report=None)
+
+    response = client.get("/pdf", params={"session_id": "missing"})
+
+    assert response.status_code == 404
+
+
+def test_pdf_returns_400_when_summary_empty(monkeypatch) -> None:
+    """PDF endpoint should reject reports without summary content."""
+    client = _build_client(monkeypatch=monkeypatch, report={"summary": "", "ai_tool": "Notion AI"})
+
+    response = client.get("/pdf", params={"session_id": "session-pdf-2"})
+
+    assert response.status_code == 400
@@ -8,7 +8,11 @@ from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async
 from sqlalchemy.pool import StaticPool
 
 from compliance_agent.billing.models import Base, BillingUser, CreditLedgerEntry, LedgerReason
-from compliance_agent.billing.service import BillingService, InsufficientCreditsError
+from compliance_agent.billing.service import (
+    BillingService,
+    InsufficientCreditsError,
+    request_debit_idempotency_key,
+)
 
 
 @pytest.fixture
@@ -48,6 +52,34 @@ def test_ensure_user_creates_identity_only_once(billing_service: BillingService)
     asyncio.run(_run())
 
 
+def test_ensure_user_reuses_cached_identity_without_db_round_trip(billing_service: BillingService) -> None:
+    """Repeated bootstrap with an unchanged email should be served from the in-process cache."""
+
+    async def _run() -> None:
+        created = await billing_service.ensure_user("sub-cache", "cache@example.com")
+
+        opened_sessions = 0
+        original_factory = billing_service._session_factory  # type: ignore[attr-defined]
+
+        def _counting_factory():
+            nonlocal opened_sessions
+            opened_sessions += 1
+            return original_factory()
+
+        billing_service._session_factory = _counting_factory  # type: ignore[attr-defined]
+
+        cached = await billing_service.ensure_user("sub-cache", "cache@example.com")
+        assert cached == created
+        assert opened_sessions == 0
+
+        updated = await billing_service.ensure_user("sub-cache", "cache-new@example.com")
+        assert updated.id == created.id
+        assert updated.email == "cache-new@example.com"
+        assert opened_sessions == 1
+
+    asyncio.run(_run())
+
+
 def test_consume_daily_credit_debits_per_request_and_is_idempotent(
     billing_service: BillingService,
 ) -> None:
@@ -81,7 +113,8 @@ def test_consume_daily_credit_debits_per_request_and_is_idempotent(
             assert len(rows) == 1
             assert rows[0].delta == -1
             assert rows[0].session_id == "session-1"
-            assert rows[0].idempotency_key == f"request-debit:{user.id}:req-1"
+            assert rows[0].idempotency_key == request_debit_idempotency_key(user.id, "req-1")
+            assert len(rows[0].idempotency_key) == 32
 
     asyncio.run(_run())
 
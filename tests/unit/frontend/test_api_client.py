@@ -0,0 +1,39 @@
+import socket
+import threading
+
+import pytest
+import requests
+
+from frontend.api_client import _build_http_session
+
+
+def test_read_timeouts_are_not_retried():
+    """A backend that accepts but never replies should be hit once, not once per retry."""
+    server = socket.socket()
+    server.bind(("127.0.0.1", 0))
+    server.listen(8)
+    server.settimeout(0.1)
+    accepted = []
+    stop = threading.Event()
+
+    def _accept_forever():
+        while not stop.is_set():
+            try:
+                accepted.append(server.accept()[0])
+            except socket.timeout:
+                continue
+
+    acceptor = threading.Thread(target=_accept_forever, daemon=True)
+    acceptor.start()
+    try:
+        url = f"http://127.0.0.1:{server.getsockname()[1]}/sessions"
+        with pytest.raises(requests.RequestException):
+            _build_http_session().get(url, timeout=(1, 0.2))
+    finally:
+        stop.set()
+        acceptor.join()
+        for conn in accepted:
+            conn.close()
+        server.close()
+
+    assert len(accepted) == 1
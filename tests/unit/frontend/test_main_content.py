@@ -0,0 +1,11 @@
+from frontend.main_content import _safe_filename
+
+
+def test_safe_filename_replaces_disallowed_characters():
+    """Punctuation and path separators should become underscores."""
+    assert _safe_filename("Notion/AI: v2.0") == "Notion_AI_ v2_0"
+
+
+def test_safe_filename_keeps_unicode_letters_and_allowed_symbols():
+    """Unicode letters, digits, spaces, dashes and underscores should be preserved."""
+    assert _safe_filename("Çalışkan-AI_3 €") == "Çalışkan-AI_3 _"
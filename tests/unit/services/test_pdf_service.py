@@ -0,0 +1,171 @@
+import io
+import re
+from types import SimpleNamespace
+
+from reportlab import rl_config
+from reportlab.lib.styles import getSampleStyleSheet
+from reportlab.platypus import Paragraph
+
+from compliance_agent.services.pdf_service import PDFService, _extract_report_fields
+
+_REPORT = """## AI Tool Assessment Report
+Provider: **Example Inc.**
+Address: Main Street 1
+
+- DPA available
+- SOC 2 report
+
+| Field | Value |
+|---|---|
+| Risk | Limited |
+"""
+
+
+def _paragraph_texts(markdown_text: str) -> list[tuple[str, str]]:
+    styles = PDFService._create_custom_styles(getSampleStyleSheet())
+    flowables = PDFService._convert_markdown_to_paragraphs(markdown_text, styles)
+    return [(item.style.name, item.text) for item in flowables if isinstance(item, Paragraph)]
+
+
+def test_markdown_blocks_become_single_paragraphs() -> None:
+    """Blocks map to Paragraphs, with list and table runs merged into one each."""
+    texts = _paragraph_texts(_REPORT)
+
+    assert texts[0] == ("CustomHeading2", "AI Tool Assessment Report")
+    assert texts[1][0] == "CustomNormal"
+    assert "<strong>Example Inc.</strong>" in texts[1][1]
+    assert "Main Street 1" in texts[1][1]
+    assert texts[2] == ("CustomNormal", "DPA available<br/>SOC 2 report")
+    assert texts[3][0] == "CustomNormal"
+    header, row = texts[3][1].split("<br/>")
+    assert "Field | Value" in header
+    assert "Risk | Limited" in row
+    assert len(texts) == 4
+
+
+def test_nested_list_items_stay_on_their_own_lines() -> None:
+    """Nested bullets should become indented lines, not leak <ul>/<li> into the Paragraph."""
+    texts = _paragraph_texts(
+        "- **Official Documentation & Core Sources:**\n"
+        "    - [Privacy Policy](https://example.com/privacy) - official\n"
+        "    - [Terms](https://example.com/terms)\n"
+        "- **Supporting Research Sources:**\n"
+    )
+
+    assert len(texts) == 1
+    lines = texts[0][1].split("<br/>")
+    assert lines == [
+        "<strong>Official Documentation &amp; Core Sources:</strong>",
+        '&nbsp;&nbsp;&nbsp;&nbsp;<a href="https://example.com/privacy" color="blue">Privacy Policy</a> - official',
+        '&nbsp;&nbsp;&nbsp;&nbsp;<a href="https://example.com/terms" color="blue">Terms</a>',
+        "<strong>Supporting Research Sources:</strong>",
+    ]
+
+
+def test_empty_blocks_do_not_emit_spacers() -> None:
+    """Blocks without content should not add flowables of their own."""
+    styles = PDFService._create_custom_styles(getSampleStyleSheet())
+    flowables = PDFService._convert_markdown_to_paragraphs("- \n- item\n", styles)
+
+    assert [type(item).__name__ for item in flowables] == ["Paragraph", "Spacer"]
+
+
+def test_markdown_links_become_blue_anchors() -> None:
+    """Links should render as anchors without swallowing neighbouring brackets."""
+    texts = _paragraph_texts("See [EU [AI] Act] and [DPA](https://example.com/dpa) (v2).")
+
+    assert texts == [
+        (
+            "CustomNormal",
+            'See [EU [AI] Act] and <a href="https://example.com/dpa" color="blue">DPA</a> (v2).',
+        )
+    ]
+
+
+def test_generate_pdf_returns_pdf_bytes() -> None:
+    """Generated output should be a non-empty PDF document."""
+    pdf_bytes = PDFService.generate_pdf(report_content=_REPORT, ai_tool_name="Example AI")
+
+    assert pdf_bytes.startswith(b"%PDF")
+
+
+def test_write_pdf_writes_to_output_stream() -> None:
+    """write_pdf should write the PDF into the given stream."""
+    output = io.BytesIO()
+
+    PDFService.write_pdf(report_content=_REPORT, ai_tool_name="Example AI", output=output)
+
+    assert output.getvalue().startswith(b"%PDF")
+
+
+def _pdf_words(pdf_bytes: bytes) -> set[str]:
+    """Collect the words drawn by text operators in an uncompressed PDF."""
+    drawn = re.findall(rb"\((.*?)\) Tj", pdf_bytes)
+    return set(re.findall(r"\w+", b" ".join(drawn).decode("latin-1")))
+
+
+def test_generate_pdf_keeps_every_word_of_the_report(monkeypatch) -> None:
+    """Definition lists, tables, nested lists and raw HTML should all reach the PDF."""
+    monkeypatch.setattr(rl_config, "pageCompression", 0)
+    report = """Opening paragraph
+
+Provider
+:   Example Incorporated
+
+| Field | Value |
+|---|---|
+| Risk | Limited |
+
+- Category heading
+    - Nested first
+    - Nested second
+- Closing bullet
+
+<span>Raw markup</span>
+"""
+
+    pdf_bytes = PDFService.generate_pdf(report_content=report, ai_tool_name="Example AI")
+
+    report_words = set(re.findall(r"[A-Za-z]+", re.sub(r"<[^>]+>", "", report)))
+    assert report_words <= _pdf_words(pdf_bytes)
+
+
+def _event(text: str):
+    part = SimpleNamespace(text=text)
+    return SimpleNamespace(content=SimpleNamespace(parts=[part]))
+
+
+def test_extract_report_fields_prefers_session_state() -> None:
+    """State values should be returned without scanning events."""
+    session = SimpleNamespace(
+        state={"ai_tool": "Notion AI", "summary": "state summary"},
+        events=[_event("Assess AI tool - Other Tool")],
+    )
+
+    assert _extract_report_fields(session) == ("Notion AI", "state summary")
+
+
+def test_extract_report_fields_falls_back_to_events() -> None:
+    """Without state, the earliest tool prompt and the latest report should be used."""
+    session = SimpleNamespace(
+        state={},
+        events=[
+            _event("Assess AI tool - Notion AI"),
+            _event("## AI Tool Assessment Report\nfirst"),
+            _event("Assess AI tool - Follow-up Tool"),
+            _event("## AI Tool Assessment Report\nrevised"),
+            SimpleNamespace(content=None),
+        ],
+    )
+
+    assert _extract_report_fields(session) == (
+        "Notion AI",
+        "## AI Tool Assessment Report\nrevised",
+    )
+
+
+def test_extract_report_fields_defaults_when_nothing_found() -> None:
+    """Missing data should yield the documented defaults."""
+    session = SimpleNamespace(state=None, events=[_event("hello")])
+
+    assert _extract_report_fields(session) == ("Unknown AI Tool", "")
@@ -0,0 +1,43 @@
+"""
+Shared fixtures for search tool tests.
+
+This module contains a stub search provider used across search tests.
+"""
+
+from typing import List, Optional
+
+import pytest
+
+from compliance_agent.tools.search_providers.base import SearchProvider, SearchProviderError
+
+
+class StubSearchProvider(SearchProvider):
+    """Search provider returning fixed organic results and counting API calls."""
+
+    def __init__(self, organic: List[dict], fail: bool = False):
+        self.organic = organic
+        self.calls = 0
+        self._fail = fail
+
+    @property
+    def name(self) -> str:
+        return "Stub"
+
+    def _execute_search(self, query: str) -> dict:
+        self.calls += 1
+        if self._fail:
+            raise SearchProviderError(self.name, "boom")
+        return {"organic": self.organic}
+
+    def _extract_organic_results(self, raw_results: dict) -> List[dict]:
+        return raw_results["organic"]
+
+
+@pytest.fixture
+def stub_provider():
+    """Create a StubSearchProvider with the given organic results."""
+
+    def _create_provider(organic: Optional[List[dict]] = None, fail: bool = False):
+        return StubSearchProvider(organic=organic if organic is not None else [], fail=fail)
+
+    return _create_provider
@@ -0,0 +1,45 @@
+import pytest
+
+from compliance_agent.tools.search_providers import (
+    GoogleSerperProvider,
+    ProviderType,
+    SearchProviderError,
+    create_search_provider,
+    reset_search_providers,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clean_provider_cache(monkeypatch):
+    monkeypatch.delenv("SERPER_API_KEY", raising=False)
+    monkeypatch.delenv("SERPAPI_API_KEY", raising=False)
+    reset_search_providers()
+    yield
+    reset_search_providers()
+
+
+def test_create_search_provider_reuses_instance_per_type(monkeypatch) -> None:
+    """Repeated factory calls should return the same provider instance."""
+    monkeypatch.setenv("SERPER_API_KEY", "serper-key")
+
+    first = create_search_provider()
+    second = create_search_provider(ProviderType.SERPER)
+
+    assert isinstance(first, GoogleSerperProvider)
+    assert second is first
+
+
+def test_reset_search_providers_forces_new_instance(monkeypatch) -> None:
+    """Resetting the cache should make the next call build a fresh provider."""
+    monkeypatch.setenv("SERPER_API_KEY", "serper-key")
+    first = create_search_provider()
+
+    reset_search_providers()
+
+    assert create_search_provider() is not first
+
+
+def test_create_search_provider_requires_an_api_key() -> None:
+    """Without any API key the factory should raise a provider error."""
+    with pytest.raises(SearchProviderError):
+        create_search_provider()
@@ -0,0 +1,49 @@
+import json
+
+import compliance_agent.tools.search as search_module
+from compliance_agent.tools.search_providers.base import SearchProvider
+
+
+_DOCS_RESULT = {"title": "Docs", "link": "https://docs.example.com", "snippet": "s"}
+
+
+def _use_provider(monkeypatch, provider: SearchProvider) -> None:
+    monkeypatch.setattr(search_module, "_search_provider", provider)
+    monkeypatch.setattr(search_module, "_search_cache", search_module.OrderedDict())
+
+
+def test_repeated_queries_are_served_from_cache(monkeypatch, stub_provider) -> None:
+    """Queries differing only in casing or whitespace should hit the provider once."""
+    provider = stub_provider([_DOCS_RESULT])
+    _use_provider(monkeypatch, provider)
+
+    first = search_module.deep_compliance_search("Notion AI  privacy")
+    second = search_module.deep_compliance_search("notion ai privacy")
+
+    assert provider.calls == 1
+    assert second == first
+    assert json.loads(first)[0]["source_type"] == "Official/Primary"
+
+
+def test_expired_entries_are_refetched(monkeypatch, stub_provider) -> None:
+    """Entries older than the TTL should trigger a new provider call."""
+    provider = stub_provider([_DOCS_RESULT])
+    _use_provider(monkeypatch, provider)
+    monkeypatch.setattr(search_module, "_search_cache_ttl_seconds", -1.0)
+
+    search_module.deep_compliance_search("notion ai")
+    search_module.deep_compliance_search("notion ai")
+
+    assert provider.calls == 2
+
+
+def test_provider_errors_are_not_cached(monkeypatch, stub_provider) -> None:
+    """Failed searches should be retried instead of replaying the error."""
+    provider = stub_provider(fail=True)
+    _use_provider(monkeypatch, provider)
+
+    first = search_module.deep_compliance_search("notion ai")
+    search_module.deep_compliance_search("notion ai")
+
+    assert "error" in json.loads(first)
+    assert provider.calls == 2
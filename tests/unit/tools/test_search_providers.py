@@ -0,0 +1,48 @@
+from compliance_agent.tools.search_providers.base import SearchResult
+
+
+def test_classify_source_matches_primary_domains_case_insensitively(stub_provider) -> None:
+    """Primary domain prefixes should be detected regardless of URL casing."""
+    provider = stub_provider()
+
+    assert provider._classify_source("https://docs.example.com/privacy") == "Official/Primary"
+    assert provider._classify_source("https://Legal.Example.com/terms") == "Official/Primary"
+    assert provider._classify_source("https://blog.example.com/post") == "Secondary"
+    assert provider._classify_source("https://example.com/docs.html") == "Secondary"
+    assert provider._classify_source("") == "Secondary"
+
+
+def test_search_builds_classified_results_up_to_max_results(stub_provider) -> None:
+    """Search should keep provider order, apply defaults, and cap the result count."""
+    provider = stub_provider(
+        [
+            {"title": "Docs", "link": "https://docs.example.com", "snippet": "a"},
+            {"title": "Blog", "link": "https://blog.example.com"},
+            {"title": "Extra", "link": "https://help.example.com", "snippet": "c"},
+        ]
+    )
+
+    results = provider.search("example", max_results=2)
+
+    assert [result.to_dict() for result in results] == [
+        {
+            "title": "Docs",
+            "link": "https://docs.example.com",
+            "snippet": "a",
+            "source_type": "Official/Primary",
+        },
+        {
+            "title": "Blog",
+            "link": "https://blog.example.com",
+            "snippet": "",
+            "source_type": "Secondary",
+        },
+    ]
+
+
+def test_search_result_has_no_instance_dict() -> None:
+    """SearchResult should be slotted so each instance skips a __dict__."""
+    result = SearchResult(title="t", link="https://docs.example.com", snippet="s")
+
+    assert not hasattr(result, "__dict__")
+    assert result.source_type == "Secondary"